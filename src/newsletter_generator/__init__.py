@@ -45,6 +45,7 @@ from newsletter_generator.aggregator import (
 from newsletter_generator.synthesizer import (
     ContentSynthesizer,
     LLMAPIError,
+    LLMCache,
     LLMClient,
     LLMError,
     LLMRateLimitError,
@@ -97,6 +98,7 @@ __all__ = [
     # Synthesis
     "ContentSynthesizer",
     "LLMAPIError",
+    "LLMCache",
     "LLMClient",
     "LLMError",
     "LLMRateLimitError",
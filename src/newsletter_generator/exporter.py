@@ -307,7 +307,7 @@ class NotesExporter:
         # Add sources if present
         if "sources" in metadata and metadata["sources"]:
             sources = metadata["sources"]
-            if isinstance(sources, list):
+            if isinstance(sources, list | tuple):
                 lines.append(f"Sources: {', '.join(sources)}")
             else:
                 lines.append(f"Sources: {sources}")
@@ -107,7 +107,7 @@ class BlogGenerator:
                 title=title,
                 content=markdown_content,
                 word_count=word_count,
-                sources=sources,
+                sources=tuple(sources),
                 generated_at=datetime.now(),
             )
             
@@ -343,9 +343,9 @@ class TikTokScriptGenerator:
             return TikTokScript(
                 title=script_data.get("title", "Tech Update"),
                 hook=script_data.get("hook", ""),
-                main_points=script_data.get("main_points", []),
+                main_points=tuple(script_data.get("main_points", [])),
                 call_to_action=script_data.get("call_to_action", ""),
-                visual_cues=visual_cues,
+                visual_cues=tuple(visual_cues) if visual_cues is not None else None,
                 duration_seconds=self.config.duration,
                 full_script=full_script,
                 generated_at=datetime.now(),
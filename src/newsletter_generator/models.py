@@ -9,6 +9,8 @@ Validates: Requirements 2.4, 4.2, 5.3
 
 from __future__ import annotations
 
+import functools
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, TYPE_CHECKING
@@ -17,7 +19,12 @@ if TYPE_CHECKING:
     pass
 
 
-@dataclass
+# Newsletter data repeats the same timestamps heavily (same publish day across
+# items, shared date ranges), so parsed datetimes are cached and shared.
+_parse_dt = functools.lru_cache(maxsize=4096)(datetime.fromisoformat)
+
+
+@dataclass(slots=True, frozen=True)
 class NewsletterItem:
     """Represents a single newsletter item from any source.
     
@@ -43,6 +50,11 @@ class NewsletterItem:
     author: str | None = None
     url: str | None = None
 
+    def __post_init__(self) -> None:
+        """Intern low-cardinality strings so equal values share one object."""
+        object.__setattr__(self, "source_name", sys.intern(self.source_name))
+        object.__setattr__(self, "source_type", sys.intern(self.source_type))
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize the NewsletterItem to a dictionary.
         
@@ -76,14 +88,14 @@ class NewsletterItem:
             source_type=data["source_type"],
             title=data["title"],
             content=data["content"],
-            published_date=datetime.fromisoformat(data["published_date"]),
+            published_date=_parse_dt(data["published_date"]),
             html_content=data.get("html_content"),
             author=data.get("author"),
             url=data.get("url"),
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TopicGroup:
     """Represents a group of related newsletter items by topic.
     
@@ -97,8 +109,12 @@ class TopicGroup:
     """
     topic: str
     description: str
-    items: list[NewsletterItem]
-    key_points: list[str]
+    items: tuple[NewsletterItem, ...]
+    key_points: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        """Intern the topic name so equal values share one object."""
+        object.__setattr__(self, "topic", sys.intern(self.topic))
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize the TopicGroup to a dictionary.
@@ -111,7 +127,7 @@ class TopicGroup:
             "topic": self.topic,
             "description": self.description,
             "items": [item.to_dict() for item in self.items],
-            "key_points": self.key_points,
+            "key_points": list(self.key_points),
         }
 
     @classmethod
@@ -127,12 +143,12 @@ class TopicGroup:
         return cls(
             topic=data["topic"],
             description=data["description"],
-            items=[NewsletterItem.from_dict(item) for item in data["items"]],
-            key_points=data["key_points"],
+            items=tuple(NewsletterItem.from_dict(item) for item in data["items"]),
+            key_points=tuple(data["key_points"]),
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SynthesizedContent:
     """Represents the fully synthesized newsletter content.
     
@@ -146,9 +162,9 @@ class SynthesizedContent:
         source_count: Number of sources processed
         date_range: Tuple of (start_date, end_date) for processed content
     """
-    topics: list[TopicGroup]
+    topics: tuple[TopicGroup, ...]
     overall_summary: str
-    trending_themes: list[str]
+    trending_themes: tuple[str, ...]
     source_count: int
     date_range: tuple[datetime, datetime]
 
@@ -162,7 +178,7 @@ class SynthesizedContent:
         return {
             "topics": [topic.to_dict() for topic in self.topics],
             "overall_summary": self.overall_summary,
-            "trending_themes": self.trending_themes,
+            "trending_themes": list(self.trending_themes),
             "source_count": self.source_count,
             "date_range": [
                 self.date_range[0].isoformat(),
@@ -181,18 +197,46 @@ class SynthesizedContent:
             A new SynthesizedContent instance.
         """
         return cls(
-            topics=[TopicGroup.from_dict(topic) for topic in data["topics"]],
+            topics=tuple(TopicGroup.from_dict(topic) for topic in data["topics"]),
             overall_summary=data["overall_summary"],
-            trending_themes=data["trending_themes"],
+            trending_themes=tuple(data["trending_themes"]),
             source_count=data["source_count"],
             date_range=(
-                datetime.fromisoformat(data["date_range"][0]),
-                datetime.fromisoformat(data["date_range"][1]),
+                _parse_dt(data["date_range"][0]),
+                _parse_dt(data["date_range"][1]),
             ),
         )
 
+    def to_msgpack(self) -> bytes:
+        """Serialize the SynthesizedContent to MessagePack bytes.
+        
+        Compact binary alternative to JSON for handing content between
+        processes. Requires the optional ``msgpack`` package.
+        
+        Returns:
+            MessagePack encoding of the to_dict() representation.
+        """
+        import msgpack
+        
+        packed: bytes = msgpack.packb(self.to_dict(), use_bin_type=True)
+        return packed
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> SynthesizedContent:
+        """Create a SynthesizedContent from MessagePack bytes.
+        
+        Args:
+            data: Bytes produced by to_msgpack().
+            
+        Returns:
+            A new SynthesizedContent instance.
+        """
+        import msgpack
+        
+        return cls.from_dict(msgpack.unpackb(data, raw=False))
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BlogPost:
     """Represents a generated blog post.
     
@@ -206,7 +250,7 @@ class BlogPost:
     title: str
     content: str
     word_count: int
-    sources: list[str]
+    sources: tuple[str, ...]
     generated_at: datetime
 
     def to_dict(self) -> dict[str, Any]:
@@ -220,7 +264,7 @@ class BlogPost:
             "title": self.title,
             "content": self.content,
             "word_count": self.word_count,
-            "sources": self.sources,
+            "sources": list(self.sources),
             "generated_at": self.generated_at.isoformat(),
         }
 
@@ -238,12 +282,12 @@ class BlogPost:
             title=data["title"],
             content=data["content"],
             word_count=data["word_count"],
-            sources=data["sources"],
-            generated_at=datetime.fromisoformat(data["generated_at"]),
+            sources=tuple(data["sources"]),
+            generated_at=_parse_dt(data["generated_at"]),
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TikTokScript:
     """Represents a generated TikTok script.
     
@@ -259,9 +303,9 @@ class TikTokScript:
     """
     title: str
     hook: str
-    main_points: list[str]
+    main_points: tuple[str, ...]
     call_to_action: str
-    visual_cues: list[str] | None
+    visual_cues: tuple[str, ...] | None
     duration_seconds: int
     full_script: str
     generated_at: datetime
@@ -276,9 +320,9 @@ class TikTokScript:
         return {
             "title": self.title,
             "hook": self.hook,
-            "main_points": self.main_points,
+            "main_points": list(self.main_points),
             "call_to_action": self.call_to_action,
-            "visual_cues": self.visual_cues,
+            "visual_cues": list(self.visual_cues) if self.visual_cues is not None else None,
             "duration_seconds": self.duration_seconds,
             "full_script": self.full_script,
             "generated_at": self.generated_at.isoformat(),
@@ -297,16 +341,16 @@ class TikTokScript:
         return cls(
             title=data["title"],
             hook=data["hook"],
-            main_points=data["main_points"],
+            main_points=tuple(data["main_points"]),
             call_to_action=data["call_to_action"],
-            visual_cues=data.get("visual_cues"),
+            visual_cues=tuple(data["visual_cues"]) if data.get("visual_cues") is not None else None,
             duration_seconds=data["duration_seconds"],
             full_script=data["full_script"],
-            generated_at=datetime.fromisoformat(data["generated_at"]),
+            generated_at=_parse_dt(data["generated_at"]),
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExportResult:
     """Represents the result of exporting content to Apple Notes.
     
@@ -356,7 +400,7 @@ class ExportResult:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecutionResult:
     """Represents the result of a full pipeline execution.
     
@@ -370,7 +414,7 @@ class ExecutionResult:
     """
     success: bool
     newsletters_processed: int
-    errors: list[str]
+    errors: tuple[str, ...]
     dry_run: bool
     blog_exported: ExportResult | None = None
     tiktok_exported: ExportResult | None = None
@@ -387,7 +431,7 @@ class ExecutionResult:
         return {
             "success": self.success,
             "newsletters_processed": self.newsletters_processed,
-            "errors": self.errors,
+            "errors": list(self.errors),
             "dry_run": self.dry_run,
             "blog_exported": self.blog_exported.to_dict() if self.blog_exported else None,
             "tiktok_exported": self.tiktok_exported.to_dict() if self.tiktok_exported else None,
@@ -406,7 +450,7 @@ class ExecutionResult:
         return cls(
             success=data["success"],
             newsletters_processed=data["newsletters_processed"],
-            errors=data["errors"],
+            errors=tuple(data["errors"]),
             dry_run=data["dry_run"],
             blog_exported=ExportResult.from_dict(data["blog_exported"]) if data.get("blog_exported") else None,
             tiktok_exported=ExportResult.from_dict(data["tiktok_exported"]) if data.get("tiktok_exported") else None,
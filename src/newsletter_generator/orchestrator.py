@@ -112,8 +112,9 @@ class NewsletterContentGenerator:
             max_tokens=self.config.llm.max_tokens,
         )
         
-        # Create synthesizer
-        self._synthesizer = ContentSynthesizer(llm_client)
+        # Create synthesizer; OpenAIClient is thread-safe, so key point
+        # extraction can run concurrently
+        self._synthesizer = ContentSynthesizer(llm_client, max_workers=4)
         
         # Create generators
         self._blog_generator = BlogGenerator(llm_client, self.config.blog)
@@ -164,7 +165,7 @@ class NewsletterContentGenerator:
                 return ExecutionResult(
                     success=True,
                     newsletters_processed=0,
-                    errors=["No newsletters found in the configured date range"],
+                    errors=("No newsletters found in the configured date range",),
                     dry_run=dry_run,
                     blog_exported=None,
                     tiktok_exported=None,
@@ -268,7 +269,7 @@ class NewsletterContentGenerator:
             return ExecutionResult(
                 success=success,
                 newsletters_processed=newsletters_processed,
-                errors=errors,
+                errors=tuple(errors),
                 dry_run=dry_run,
                 blog_exported=blog_exported,
                 tiktok_exported=tiktok_exported,
@@ -286,7 +287,7 @@ class NewsletterContentGenerator:
             return ExecutionResult(
                 success=False,
                 newsletters_processed=newsletters_processed,
-                errors=errors,
+                errors=tuple(errors),
                 dry_run=dry_run,
                 blog_exported=blog_exported,
                 tiktok_exported=tiktok_exported,
@@ -9,14 +9,27 @@ Validates: Requirements 3.1, 3.2, 3.3, 3.4, 3.5
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import heapq
 import json
 import logging
+import random
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 import openai
 from openai import APIConnectionError, APIStatusError, RateLimitError
 
+try:
+    import orjson
+except ImportError:  # optional "fast" extra; fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from newsletter_generator.models import (
         NewsletterItem,
@@ -26,6 +39,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Filler words ignored when comparing titles for duplicates
+_STOPWORDS = frozenset({"a", "an", "the", "of", "and", "to", "for", "in", "on", "with"})
+
 
 class LLMError(Exception):
     """Base exception for LLM-related errors."""
@@ -47,7 +63,9 @@ class LLMClient(Protocol):
     """Protocol for LLM client implementations.
     
     Defines the interface that all LLM clients must implement
-    to be used with the ContentSynthesizer.
+    to be used with the ContentSynthesizer. Clients passed to a
+    ContentSynthesizer with max_workers > 1 must be safe to call
+    from several threads at once.
     """
     
     def complete(self, prompt: str, system: str | None = None) -> str:
@@ -63,15 +81,113 @@ class LLMClient(Protocol):
         ...
 
 
+@functools.lru_cache(maxsize=16)
+def _openai_client(api_key: str) -> openai.OpenAI:
+    """Return a shared OpenAI SDK client for an API key.
+    
+    The SDK client owns an HTTP connection pool, so OpenAIClient instances
+    using the same key reuse one client instead of opening a new pool each.
+    """
+    return openai.OpenAI(api_key=api_key)
+
+
+class LLMCache:
+    """In-memory LRU cache for LLM responses.
+    
+    Entries are keyed by a hash of the model, token limit, system prompt and
+    user prompt, and may carry a time-to-live after which they are treated
+    as missing.
+    Safe to share between threads.
+    
+    Attributes:
+        max_entries: Maximum number of responses kept before evicting the
+            least recently used one
+        default_ttl: Lifetime in seconds applied when set() is given no ttl,
+            or None to keep entries until evicted
+    """
+    
+    def __init__(self, max_entries: int = 256, default_ttl: float | None = None) -> None:
+        """Initialize an empty cache.
+        
+        Args:
+            max_entries: Maximum number of cached responses (default: 256)
+            default_ttl: Default entry lifetime in seconds (default: None)
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(model: str, max_tokens: int, system: str | None, prompt: str) -> str:
+        """Build the cache key for a completion request.
+        
+        Args:
+            model: Model identifier
+            max_tokens: Completion token limit, which can truncate the response
+            system: Optional system prompt
+            prompt: User prompt
+            
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        payload = json.dumps(
+            {"m": model, "t": max_tokens, "s": system, "p": prompt}, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> str | None:
+        """Return the cached response for key, or None if missing or expired.
+        
+        Args:
+            key: Cache key from make_key()
+            
+        Returns:
+            The cached response text, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Store a response, evicting the least recently used entry if full.
+        
+        Args:
+            key: Cache key from make_key()
+            value: Response text to cache
+            ttl: Entry lifetime in seconds (default: default_ttl)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
 class OpenAIClient:
     """LLM client implementation using OpenAI's API.
     
     Handles API errors and rate limiting with exponential backoff retries.
+    Responses can optionally be memoized in an LLMCache so identical
+    requests skip the API round-trip. Safe to call from several threads.
     
     Attributes:
         model: The OpenAI model to use
         max_retries: Maximum number of retry attempts
         base_delay: Base delay in seconds for exponential backoff
+        cache: Optional response cache
     """
     
     def __init__(
@@ -81,6 +197,7 @@ class OpenAIClient:
         max_retries: int = 3,
         base_delay: float = 1.0,
         max_tokens: int = 4096,
+        cache: LLMCache | None = None,
     ) -> None:
         """Initialize the OpenAI client.
         
@@ -90,12 +207,14 @@ class OpenAIClient:
             max_retries: Maximum number of retry attempts (default: 3)
             base_delay: Base delay in seconds for exponential backoff (default: 1.0)
             max_tokens: Maximum tokens for response (default: 4096)
+            cache: Optional cache for responses to identical requests (default: None)
         """
         self.model = model
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_tokens = max_tokens
-        self._client = openai.OpenAI(api_key=api_key)
+        self.cache = cache
+        self._client = _openai_client(api_key)
     
     def complete(self, prompt: str, system: str | None = None) -> str:
         """Send a prompt to OpenAI and return the response.
@@ -114,12 +233,13 @@ class OpenAIClient:
             LLMRateLimitError: If rate limit exceeded after all retries
             LLMAPIError: If API call fails after all retries
         """
-        messages: list[dict[str, str]] = []
-        
-        if system:
-            messages.append({"role": "system", "content": system})
+        if self.cache is not None:
+            cache_key = LLMCache.make_key(self.model, self.max_tokens, system, prompt)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system)
         
         last_error: Exception | None = None
         
@@ -135,23 +255,17 @@ class OpenAIClient:
                 if content is None:
                     raise LLMAPIError("Empty response from OpenAI API")
                 
+                if self.cache is not None:
+                    self.cache.set(cache_key, content)
                 return content
                 
             except RateLimitError as e:
                 last_error = e
-                delay = self.base_delay * (2 ** attempt)
-                logger.warning(
-                    f"Rate limit hit, retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})"
-                )
-                time.sleep(delay)
+                self._wait_before_retry(attempt, "Rate limit hit")
                 
             except APIConnectionError as e:
                 last_error = e
-                delay = self.base_delay * (2 ** attempt)
-                logger.warning(
-                    f"Connection error, retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries}): {e}"
-                )
-                time.sleep(delay)
+                self._wait_before_retry(attempt, f"Connection error ({e})")
                 
             except APIStatusError as e:
                 # Don't retry on client errors (4xx except 429)
@@ -159,11 +273,7 @@ class OpenAIClient:
                     raise LLMAPIError(f"OpenAI API error: {e.message}") from e
                 
                 last_error = e
-                delay = self.base_delay * (2 ** attempt)
-                logger.warning(
-                    f"API error {e.status_code}, retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})"
-                )
-                time.sleep(delay)
+                self._wait_before_retry(attempt, f"API error {e.status_code}")
         
         # All retries exhausted
         if isinstance(last_error, RateLimitError):
@@ -174,6 +284,44 @@ class OpenAIClient:
         raise LLMAPIError(
             f"OpenAI API call failed after {self.max_retries} retries: {last_error}"
         ) from last_error
+    
+    @staticmethod
+    def _build_messages(prompt: str, system: str | None) -> list[dict[str, str]]:
+        """Build the chat messages for a request.
+        
+        Args:
+            prompt: The user prompt to send
+            system: Optional system prompt for context
+            
+        Returns:
+            Message list with the system message first, when given
+        """
+        if system:
+            return [
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt},
+            ]
+        return [{"role": "user", "content": prompt}]
+    
+    def _wait_before_retry(self, attempt: int, reason: str) -> None:
+        """Sleep with jittered exponential backoff before the next attempt.
+        
+        The jitter spreads out retries from concurrent callers hitting the
+        same limit. Nothing is retried after the final attempt, so no sleep
+        follows it.
+        
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            reason: Short description of the failure for the log message
+        """
+        if attempt + 1 >= self.max_retries:
+            return
+        
+        delay = self.base_delay * (2 ** attempt) + random.uniform(0, self.base_delay)
+        logger.warning(
+            f"{reason}, retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})"
+        )
+        time.sleep(delay)
 
 
 class ContentSynthesizer:
@@ -184,13 +332,17 @@ class ContentSynthesizer:
     
     Attributes:
         llm: LLM client for content analysis
+        max_workers: Maximum number of concurrent key point extractions
     """
     
-    def __init__(self, llm: LLMClient) -> None:
+    def __init__(self, llm: LLMClient, max_workers: int = 1) -> None:
         """Initialize the synthesizer.
         
         Args:
             llm: LLM client to use for content analysis
+            max_workers: Maximum number of topic groups whose key points are
+                extracted concurrently (default: 1). Values above 1 call llm
+                from worker threads, so the client must be thread-safe.
         """
         # Import here to avoid circular imports
         from newsletter_generator.models import (
@@ -202,6 +354,7 @@ class ContentSynthesizer:
         self._SynthesizedContent = SynthesizedContent
         self._TopicGroup = TopicGroup
         self.llm = llm
+        self.max_workers = max_workers
     
     def group_by_topic(self, items: list[NewsletterItem]) -> list[TopicGroup]:
         """Group newsletter items by topic using LLM analysis.
@@ -257,43 +410,42 @@ Respond with ONLY the JSON array, no other text:"""
                 return [TopicGroup(
                     topic="General Tech News",
                     description="Mixed technology news and updates",
-                    items=items,
-                    key_points=[],
+                    items=tuple(items),
+                    key_points=(),
                 )]
             
-            # Build topic groups from LLM response
+            # Build topic groups from LLM response, reading each entry once
             topic_groups: list[TopicGroup] = []
+            assigned_indices: set[int] = set()
+            num_items = len(items)
             for group_data in topic_data:
                 indices = group_data.get("item_indices", [])
-                group_items = [items[i] for i in indices if 0 <= i < len(items)]
+                assigned_indices.update(indices)
+                group_items = tuple(items[i] for i in indices if 0 <= i < num_items)
                 
                 if group_items:  # Only create group if it has items
                     topic_groups.append(TopicGroup(
-                        topic=group_data.get("topic", "Unknown Topic"),
+                        topic=str(group_data.get("topic") or "Unknown Topic"),
                         description=group_data.get("description", ""),
                         items=group_items,
-                        key_points=[],  # Will be filled by extract_key_points
+                        key_points=(),  # Will be filled by extract_key_points
                     ))
             
             # Handle any items not assigned to a topic
-            assigned_indices = set()
-            for group_data in topic_data:
-                assigned_indices.update(group_data.get("item_indices", []))
-            
-            unassigned = [items[i] for i in range(len(items)) if i not in assigned_indices]
+            unassigned = [items[i] for i in range(num_items) if i not in assigned_indices]
             if unassigned:
                 topic_groups.append(TopicGroup(
                     topic="Other News",
                     description="Additional tech news and updates",
-                    items=unassigned,
-                    key_points=[],
+                    items=tuple(unassigned),
+                    key_points=(),
                 ))
             
             return topic_groups if topic_groups else [TopicGroup(
                 topic="General Tech News",
                 description="Mixed technology news and updates",
-                items=items,
-                key_points=[],
+                items=tuple(items),
+                key_points=(),
             )]
             
         except (LLMError, json.JSONDecodeError) as e:
@@ -302,8 +454,8 @@ Respond with ONLY the JSON array, no other text:"""
             return [TopicGroup(
                 topic="General Tech News",
                 description="Mixed technology news and updates",
-                items=items,
-                key_points=[],
+                items=tuple(items),
+                key_points=(),
             )]
     
     def extract_key_points(self, group: TopicGroup) -> list[str]:
@@ -321,12 +473,7 @@ Respond with ONLY the JSON array, no other text:"""
         if not group.items:
             return []
         
-        # Build content for analysis
-        content_parts = []
-        for item in group.items:
-            content_parts.append(f"Title: {item.title}\nContent: {item.content[:1000]}")
-        
-        combined_content = "\n\n---\n\n".join(content_parts)
+        combined_content = self._build_group_content(group)
         
         system_prompt = """You are a content analyst. Extract the most important key points from the provided content.
 Respond ONLY with valid JSON, no other text."""
@@ -361,6 +508,77 @@ Respond with ONLY the JSON array, no other text:"""
             logger.error(f"Failed to extract key points: {e}")
             return []
     
+    def extract_key_points_batch(self, groups: list[TopicGroup]) -> list[list[str]]:
+        """Extract key points for several topic groups with one LLM call.
+        
+        Sends every group's content in a single prompt and maps the
+        response back onto the groups. If the batched response cannot be
+        used, falls back to extract_key_points() for each group; groups
+        missing from an otherwise usable response are extracted the same way.
+        
+        Args:
+            groups: Topic groups to analyze
+            
+        Returns:
+            Key points for each group, in the same order as groups
+        """
+        indexed = [(i, group) for i, group in enumerate(groups) if group.items]
+        if len(indexed) <= 1:
+            return self._extract_key_points_per_group(groups)
+        
+        sections = "\n\n===\n\n".join(
+            f'[{i}] Topic: "{group.topic}"\n\n{self._build_group_content(group)}'
+            for i, group in indexed
+        )
+        
+        system_prompt = """You are a content analyst. Extract the most important key points from the provided content.
+Respond ONLY with valid JSON, no other text."""
+        
+        user_prompt = f"""Extract 3-7 key points for each of these numbered topics:
+
+{sections}
+
+Respond with a JSON object mapping each topic number (as a string) to an array of strings,
+each being a concise key point (1-2 sentences).
+Focus on:
+- Important announcements or releases
+- Key trends or insights
+- Notable statistics or facts
+- Actionable information
+
+Example response format:
+{{"0": ["Key point 1 about the first topic.", "Key point 2 with important details."], "1": ["Key point 1 about the second topic."]}}
+
+Respond with ONLY the JSON object, no other text:"""
+        
+        try:
+            response = self.llm.complete(user_prompt, system_prompt)
+            points_by_index = self._parse_json_response(response)
+        except (LLMError, json.JSONDecodeError) as e:
+            logger.warning(f"Batched key point extraction failed, extracting per group: {e}")
+            return self._extract_key_points_per_group(groups)
+        
+        if not isinstance(points_by_index, dict):
+            logger.warning("LLM returned non-object response for batched key points, extracting per group")
+            return self._extract_key_points_per_group(groups)
+        
+        key_points_per_group: list[list[str]] = [[] for _ in groups]
+        missing: list[int] = []
+        for i in range(len(groups)):
+            points = points_by_index.get(str(i))
+            if isinstance(points, list):
+                key_points_per_group[i] = [str(point) for point in points if point]
+            else:
+                missing.append(i)
+        
+        # Groups the batched response skipped or mangled are retried one by one
+        if missing:
+            logger.warning(f"Batched key points missing for {len(missing)} group(s), extracting per group")
+            retried = self._extract_key_points_per_group([groups[i] for i in missing])
+            for i, points in zip(missing, retried, strict=True):
+                key_points_per_group[i] = points
+        return key_points_per_group
+    
     def generate_summary(self, topics: list[TopicGroup]) -> str:
         """Generate an overall summary of all topics.
         
@@ -429,9 +647,9 @@ Keep the summary concise but informative (150-300 words)."""
         
         if not items:
             return SynthesizedContent(
-                topics=[],
+                topics=(),
                 overall_summary="No newsletter content available for synthesis.",
-                trending_themes=[],
+                trending_themes=(),
                 source_count=0,
                 date_range=(datetime.now(), datetime.now()),
             )
@@ -442,9 +660,13 @@ Keep the summary concise but informative (150-300 words)."""
         # Group by topic
         topic_groups = self.group_by_topic(deduplicated_items)
         
-        # Extract key points for each group
-        for group in topic_groups:
-            group.key_points.extend(self.extract_key_points(group))
+        # Extract key points for all groups in one request
+        key_points_per_group = self.extract_key_points_batch(topic_groups)
+        
+        topic_groups = [
+            replace(group, key_points=group.key_points + tuple(key_points))
+            for group, key_points in zip(topic_groups, key_points_per_group, strict=True)
+        ]
         
         # Generate overall summary
         overall_summary = self.generate_summary(topic_groups)
@@ -460,13 +682,43 @@ Keep the summary concise but informative (150-300 words)."""
         source_count = len(set(item.source_name for item in items))
         
         return SynthesizedContent(
-            topics=topic_groups,
+            topics=tuple(topic_groups),
             overall_summary=overall_summary,
-            trending_themes=trending_themes,
+            trending_themes=tuple(trending_themes),
             source_count=source_count,
             date_range=date_range,
         )
     
+    def _extract_key_points_per_group(self, groups: list[TopicGroup]) -> list[list[str]]:
+        """Extract key points with one LLM call per group.
+        
+        Each call is an independent round-trip, so they run concurrently
+        when max_workers > 1.
+        
+        Args:
+            groups: Topic groups to analyze
+            
+        Returns:
+            Key points for each group, in the same order as groups
+        """
+        if self.max_workers > 1 and len(groups) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(groups))) as pool:
+                return list(pool.map(self.extract_key_points, groups))
+        return [self.extract_key_points(group) for group in groups]
+    
+    def _build_group_content(self, group: TopicGroup) -> str:
+        """Build the item content of a topic group for LLM analysis.
+        
+        Args:
+            group: Topic group to format
+            
+        Returns:
+            Formatted titles and truncated content of the group's items
+        """
+        return "\n\n---\n\n".join(
+            f"Title: {item.title}\nContent: {item.content[:1000]}" for item in group.items
+        )
+    
     def _build_items_summary(self, items: list[NewsletterItem]) -> str:
         """Build a summary of items for LLM analysis.
         
@@ -499,17 +751,22 @@ Keep the summary concise but informative (150-300 words)."""
         Raises:
             json.JSONDecodeError: If JSON parsing fails
         """
-        # Clean up response - remove markdown code blocks if present
+        # Clean up response - remove markdown code blocks if present.
+        # Most responses are unfenced and skip the slicing entirely.
         cleaned = response.strip()
-        if cleaned.startswith("```json"):
-            cleaned = cleaned[7:]
-        elif cleaned.startswith("```"):
-            cleaned = cleaned[3:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
-        cleaned = cleaned.strip()
-        
-        return json.loads(cleaned)
+        if cleaned.startswith("```") or cleaned.endswith("```"):
+            if cleaned.startswith("```json"):
+                cleaned = cleaned[7:]
+            elif cleaned.startswith("```"):
+                cleaned = cleaned[3:]
+            if cleaned.endswith("```"):
+                cleaned = cleaned[:-3]
+            cleaned = cleaned.strip()
+        
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+        # handle both decoders the same way
+        parsed: list | dict = orjson.loads(cleaned) if orjson is not None else json.loads(cleaned)
+        return parsed
     
     def _deduplicate_items(self, items: list[NewsletterItem]) -> list[NewsletterItem]:
         """Detect and merge duplicate/overlapping content.
@@ -527,32 +784,56 @@ Keep the summary concise but informative (150-300 words)."""
         if len(items) <= 1:
             return items
         
-        # Simple deduplication based on title similarity
+        # Deduplicate on title similarity. Titles can only be similar if
+        # they are identical or share a word, so an inverted word index
+        # narrows each lookup to a few candidates instead of every kept title.
         seen_titles: dict[str, NewsletterItem] = {}
-        deduplicated: list[NewsletterItem] = []
+        seen_order: dict[str, int] = {}
+        seen_words: dict[str, frozenset[str]] = {}
+        titles_by_word: dict[str, set[str]] = {}
         
-        for item in items:
+        for position, item in enumerate(items):
             # Normalize title for comparison
             normalized_title = item.title.lower().strip()
+            # Tokenize once; kept titles reuse their stored word sets
+            words = self._title_words(normalized_title)
+            
+            candidates: set[str] = set()
+            for word in words:
+                candidates.update(titles_by_word.get(word, ()))
+            if normalized_title in seen_titles:
+                candidates.add(normalized_title)
+            
+            # Match against the earliest kept title, as a full scan would
+            match = next(
+                (
+                    seen_title
+                    for seen_title in sorted(candidates, key=seen_order.__getitem__)
+                    if seen_title == normalized_title
+                    or self._word_sets_similar(words, seen_words[seen_title])
+                ),
+                None,
+            )
             
-            # Check for similar titles (exact match or high overlap)
-            is_duplicate = False
-            for seen_title, seen_item in seen_titles.items():
-                if self._titles_similar(normalized_title, seen_title):
-                    # Keep the item with more content
-                    if len(item.content) > len(seen_item.content):
-                        # Replace with the more detailed item
-                        deduplicated.remove(seen_item)
-                        deduplicated.append(item)
-                        seen_titles[normalized_title] = item
-                        del seen_titles[seen_title]
-                    is_duplicate = True
-                    logger.debug(f"Duplicate detected: '{item.title}' similar to '{seen_item.title}'")
-                    break
-            
-            if not is_duplicate:
-                seen_titles[normalized_title] = item
-                deduplicated.append(item)
+            if match is not None:
+                seen_item = seen_titles[match]
+                logger.debug(f"Duplicate detected: '{item.title}' similar to '{seen_item.title}'")
+                # Keep the item with more content
+                if len(item.content) <= len(seen_item.content):
+                    continue
+                # Replace with the more detailed item
+                del seen_titles[match]
+                del seen_order[match]
+                for word in seen_words.pop(match):
+                    titles_by_word[word].discard(match)
+            
+            seen_titles[normalized_title] = item
+            seen_order[normalized_title] = position
+            seen_words[normalized_title] = words
+            for word in words:
+                titles_by_word.setdefault(word, set()).add(normalized_title)
+        
+        deduplicated = list(seen_titles.values())
         
         if len(deduplicated) < len(items):
             logger.info(f"Deduplicated {len(items)} items to {len(deduplicated)}")
@@ -573,10 +854,32 @@ Keep the summary concise but informative (150-300 words)."""
         if title1 == title2:
             return True
         
-        # Check word overlap (simple Jaccard-like similarity)
-        words1 = set(title1.split())
-        words2 = set(title2.split())
+        return self._word_sets_similar(self._title_words(title1), self._title_words(title2))
+    
+    @staticmethod
+    def _title_words(title: str) -> frozenset[str]:
+        """Split a normalized title into the words used for similarity.
         
+        Args:
+            title: Normalized (lowercased, stripped) title
+            
+        Returns:
+            The title's distinct words, excluding stopwords
+        """
+        return frozenset(title.split()) - _STOPWORDS
+    
+    @staticmethod
+    def _word_sets_similar(words1: frozenset[str], words2: frozenset[str]) -> bool:
+        """Check if two titles' word sets overlap enough to be duplicates.
+        
+        Args:
+            words1: Words of the first normalized title
+            words2: Words of the second normalized title
+            
+        Returns:
+            True if the word sets are similar
+        """
+        # Check word overlap (simple Jaccard-like similarity)
         if not words1 or not words2:
             return False
         
@@ -595,6 +898,7 @@ Keep the summary concise but informative (150-300 words)."""
         Returns:
             List of trending theme names
         """
-        # Simple extraction: use topic names as themes, sorted by item count
-        themes = sorted(topics, key=lambda t: len(t.items), reverse=True)
-        return [t.topic for t in themes[:5]]  # Top 5 themes
+        # Simple extraction: use topic names as themes, ranked by item count.
+        # nlargest matches sorted(..., reverse=True)[:5], ties included.
+        themes = heapq.nlargest(5, topics, key=lambda t: len(t.items))
+        return [t.topic for t in themes]
@@ -9,7 +9,9 @@ import os
 from datetime import datetime, timezone
 
 import pytest
-from hypothesis import settings, Verbosity
+from hypothesis import Phase, settings, Verbosity
+
+from newsletter_generator.models import NewsletterItem, SynthesizedContent, TopicGroup
 
 # Configure Hypothesis profiles
 # Default profile: Reduced examples for faster iteration
@@ -36,6 +38,13 @@ settings.register_profile(
     verbosity=Verbosity.verbose,
 )
 
+# Fast profile: Replay only explicit @example cases, skipping generation
+settings.register_profile(
+    "fast",
+    phases=[Phase.explicit],
+    deadline=None,
+)
+
 # Load profile from environment variable or use default
 profile_name = os.getenv("HYPOTHESIS_PROFILE", "default")
 settings.load_profile(profile_name)
@@ -61,3 +70,40 @@ def temp_output_dir(tmp_path):
     output_dir = tmp_path / "output"
     output_dir.mkdir()
     return output_dir
+
+
+# Model fixtures are frozen dataclasses, so a single instance can safely be
+# shared by every test in a module.
+@pytest.fixture(scope="module")
+def sample_item() -> NewsletterItem:
+    """Provide a canonical NewsletterItem for testing."""
+    return NewsletterItem(
+        source_name="Source1",
+        source_type="rss",
+        title="Article 1",
+        content="Content 1",
+        published_date=datetime(2024, 1, 15),
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_topic_group(sample_item: NewsletterItem) -> TopicGroup:
+    """Provide a TopicGroup containing the canonical item."""
+    return TopicGroup(
+        topic="Tech News",
+        description="Latest tech news",
+        items=(sample_item,),
+        key_points=("Key point",),
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_synthesized_content(sample_topic_group: TopicGroup) -> SynthesizedContent:
+    """Provide SynthesizedContent built from the canonical topic group."""
+    return SynthesizedContent(
+        topics=(sample_topic_group,),
+        overall_summary="Summary",
+        trending_themes=("AI",),
+        source_count=3,
+        date_range=(datetime(2024, 1, 8), datetime(2024, 1, 15)),
+    )
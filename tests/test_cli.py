@@ -10,6 +10,18 @@ import sys
 import os
 
 from newsletter_generator.cli import create_parser, run_command, validate_command, main
+from newsletter_generator.models import ExecutionResult, ExportResult
+
+
+# Results are frozen dataclasses, so one instance serves every mocked run
+_DRY_RUN_RESULT = ExecutionResult(
+    success=True,
+    newsletters_processed=5,
+    errors=(),
+    dry_run=True,
+    blog_exported=ExportResult(success=True, folder="Blog"),
+    tiktok_exported=ExportResult(success=True, folder="TikTok"),
+)
 
 
 class TestCLIParser:
@@ -178,14 +190,7 @@ date_range_days: 7
             mock_instance = MagicMock()
             mock_gen.return_value = mock_instance
             
-            # Create a mock result
-            mock_result = MagicMock()
-            mock_result.success = True
-            mock_result.newsletters_processed = 5
-            mock_result.errors = []
-            mock_result.blog_exported = MagicMock(success=True, folder="Blog", fallback_path=None)
-            mock_result.tiktok_exported = MagicMock(success=True, folder="TikTok", fallback_path=None)
-            mock_instance.run.return_value = mock_result
+            mock_instance.run.return_value = _DRY_RUN_RESULT
             
             with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
                 result = run_command(str(config_file), dry_run=True)
@@ -236,13 +241,7 @@ date_range_days: 7
             mock_instance = MagicMock()
             mock_gen.return_value = mock_instance
             
-            mock_result = MagicMock()
-            mock_result.success = True
-            mock_result.newsletters_processed = 5
-            mock_result.errors = []
-            mock_result.blog_exported = MagicMock(success=True, folder="Blog", fallback_path=None)
-            mock_result.tiktok_exported = MagicMock(success=True, folder="TikTok", fallback_path=None)
-            mock_instance.run.return_value = mock_result
+            mock_instance.run.return_value = _DRY_RUN_RESULT
             
             with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
                 with patch("sys.argv", ["newsletter-generator", "run", "-c", str(config_file), "--dry-run"]):
@@ -44,7 +44,7 @@ def valid_blog_post(draw: st.DrawFn) -> BlogPost:
             st.text(min_size=1, max_size=30).filter(lambda s: s.strip()),
             min_size=1,
             max_size=5,
-        )),
+        ).map(tuple)),
         generated_at=draw(st.datetimes(
             min_value=datetime(2020, 1, 1),
             max_value=datetime(2025, 12, 31),
@@ -60,7 +60,7 @@ def valid_tiktok_script(draw: st.DrawFn) -> TikTokScript:
         st.text(min_size=5, max_size=100).filter(lambda s: s.strip()),
         min_size=1,
         max_size=5,
-    ))
+    ).map(tuple))
     cta = draw(st.text(min_size=5, max_size=100).filter(lambda s: s.strip()))
     
     full_script = f"{hook}\n\n" + "\n".join(main_points) + f"\n\n{cta}"
@@ -72,7 +72,7 @@ def valid_tiktok_script(draw: st.DrawFn) -> TikTokScript:
             st.text(min_size=5, max_size=50).filter(lambda s: s.strip()),
             min_size=1,
             max_size=3,
-        ))
+        ).map(tuple))
     
     return TikTokScript(
         title=draw(st.text(min_size=1, max_size=50).filter(lambda s: s.strip())),
@@ -122,7 +122,7 @@ class TestNotesExporter:
             title="Tech Trends This Week",
             content="# Tech Trends This Week\n\nContent here...\n\n## Section\n\n- Point 1",
             word_count=100,
-            sources=["TechCrunch", "Hacker News"],
+            sources=("TechCrunch", "Hacker News"),
             generated_at=datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
         )
     
@@ -132,9 +132,9 @@ class TestNotesExporter:
         return TikTokScript(
             title="Tech Update",
             hook="Stop scrolling!",
-            main_points=["AI is changing everything", "New tools are here"],
+            main_points=("AI is changing everything", "New tools are here"),
             call_to_action="Follow for more!",
-            visual_cues=["Show logos", "Display stats"],
+            visual_cues=("Show logos", "Display stats"),
             duration_seconds=60,
             full_script="Stop scrolling!\n\nAI is changing everything\nNew tools are here\n\nFollow for more!",
             generated_at=datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc),
@@ -8,12 +8,13 @@ Property tests:
 - Property 13: Dry-Run Mode (Validates: Requirements 7.4)
 """
 
+import json
 from datetime import datetime, timezone
-from typing import Any
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator
 
 import pytest
-from hypothesis import given, settings, assume
+from hypothesis import assume, example, given, settings
 from hypothesis import strategies as st
 
 from newsletter_generator.config import (
@@ -33,7 +34,6 @@ from newsletter_generator.models import (
     NewsletterItem,
     SynthesizedContent,
     TikTokScript,
-    TopicGroup,
 )
 from newsletter_generator.orchestrator import NewsletterContentGenerator
 
@@ -42,34 +42,46 @@ from newsletter_generator.orchestrator import NewsletterContentGenerator
 # Mock Components for Testing
 # =============================================================================
 
+# Fixed timestamp for all mock output, keeping runs deterministic
+_FROZEN_TS = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+# Canned LLM responses, encoded once at import
+_TIKTOK_JSON = json.dumps({
+    "title": "Tech Update",
+    "hook": "Stop scrolling!",
+    "main_points": ["AI is changing everything", "New tools are here"],
+    "call_to_action": "Follow for more!",
+    "visual_cues": ["Show tech logos", "Display stats"],
+})
+_TOPIC_JSON = json.dumps([
+    {"topic": "AI Development", "description": "AI news", "item_indices": [0]}
+])
+_KEYPOINT_JSON = json.dumps(["Key point 1", "Key point 2"])
+_DEFAULT_RESP = "Tech Trends\n\n# Tech Trends\n\nThis week in tech..."
+
+
 class MockLLMClient:
     """Mock LLM client for testing."""
     
+    __slots__ = ()
+    
     def complete(self, prompt: str, system: str | None = None) -> str:
         """Return deterministic responses based on prompt content."""
-        import json
-        
-        if "TikTok" in prompt or "tiktok" in prompt.lower():
-            return json.dumps({
-                "title": "Tech Update",
-                "hook": "Stop scrolling!",
-                "main_points": ["AI is changing everything", "New tools are here"],
-                "call_to_action": "Follow for more!",
-                "visual_cues": ["Show tech logos", "Display stats"],
-            })
-        elif "topic" in prompt.lower() and "group" in prompt.lower():
-            return json.dumps([
-                {"topic": "AI Development", "description": "AI news", "item_indices": [0]}
-            ])
-        elif "key point" in prompt.lower():
-            return json.dumps(["Key point 1", "Key point 2"])
-        else:
-            return "Tech Trends\n\n# Tech Trends\n\nThis week in tech..."
+        prompt_lower = prompt.lower()
+        if "tiktok" in prompt_lower:
+            return _TIKTOK_JSON
+        if "topic" in prompt_lower and "group" in prompt_lower:
+            return _TOPIC_JSON
+        if "key point" in prompt_lower:
+            return _KEYPOINT_JSON
+        return _DEFAULT_RESP
 
 
 class MockAggregator:
     """Mock aggregator for testing."""
     
+    __slots__ = ("items", "aggregate_called")
+    
     def __init__(self, items: list[NewsletterItem] | None = None):
         self.items = items or []
         self.aggregate_called = False
@@ -82,6 +94,8 @@ class MockAggregator:
 class MockSynthesizer:
     """Mock synthesizer for testing."""
     
+    __slots__ = ("content", "synthesize_called")
+    
     def __init__(self, content: SynthesizedContent | None = None):
         self.content = content
         self.synthesize_called = False
@@ -91,17 +105,19 @@ class MockSynthesizer:
         if self.content:
             return self.content
         return SynthesizedContent(
-            topics=[],
+            topics=(),
             overall_summary="Test summary",
-            trending_themes=["AI"],
+            trending_themes=("AI",),
             source_count=len(items),
-            date_range=(datetime.now(), datetime.now()),
+            date_range=(_FROZEN_TS, _FROZEN_TS),
         )
 
 
 class MockBlogGenerator:
     """Mock blog generator for testing."""
     
+    __slots__ = ("post", "generate_called")
+    
     def __init__(self, post: BlogPost | None = None):
         self.post = post
         self.generate_called = False
@@ -114,14 +130,16 @@ class MockBlogGenerator:
             title="Test Blog Post",
             content="# Test\n\nContent here",
             word_count=100,
-            sources=["Source1"],
-            generated_at=datetime.now(),
+            sources=("Source1",),
+            generated_at=_FROZEN_TS,
         )
 
 
 class MockTikTokGenerator:
     """Mock TikTok generator for testing."""
     
+    __slots__ = ("script", "generate_called")
+    
     def __init__(self, script: TikTokScript | None = None):
         self.script = script
         self.generate_called = False
@@ -133,25 +151,27 @@ class MockTikTokGenerator:
         return TikTokScript(
             title="Test Script",
             hook="Stop scrolling!",
-            main_points=["Point 1", "Point 2"],
+            main_points=("Point 1", "Point 2"),
             call_to_action="Follow!",
-            visual_cues=["Cue 1"],
+            visual_cues=("Cue 1",),
             duration_seconds=60,
             full_script="Stop scrolling! Point 1. Point 2. Follow!",
-            generated_at=datetime.now(),
+            generated_at=_FROZEN_TS,
         )
 
 
 class MockExporter:
     """Mock exporter for testing."""
     
+    __slots__ = ("blog_result", "tiktok_result", "export_blog_called", "export_tiktok_called")
+    
+    # ExportResult is frozen, so the defaults can be shared by every instance
+    _DEFAULT_BLOG = ExportResult(success=True, folder="Blog", note_id="note-123")
+    _DEFAULT_TIKTOK = ExportResult(success=True, folder="TikTok", note_id="note-456")
+    
     def __init__(self, blog_result: ExportResult | None = None, tiktok_result: ExportResult | None = None):
-        self.blog_result = blog_result or ExportResult(
-            success=True, folder="Blog", note_id="note-123"
-        )
-        self.tiktok_result = tiktok_result or ExportResult(
-            success=True, folder="TikTok", note_id="note-456"
-        )
+        self.blog_result = blog_result or MockExporter._DEFAULT_BLOG
+        self.tiktok_result = tiktok_result or MockExporter._DEFAULT_TIKTOK
         self.export_blog_called = False
         self.export_tiktok_called = False
     
@@ -168,6 +188,17 @@ class MockExporter:
 # Hypothesis Strategies
 # =============================================================================
 
+# Leaf strategies are built once and shared by every draw
+_BLOG_FORMAT_ST = st.sampled_from(["long-form", "summary", "listicle"])
+_TARGET_WORDS_ST = st.integers(min_value=200, max_value=2000)
+_INCLUDE_SOURCES_ST = st.booleans()
+_TIKTOK_DUR_ST = st.sampled_from([15, 30, 60])
+_VISUAL_CUES_ST = st.booleans()
+_TIKTOK_STYLE_ST = st.sampled_from(["educational", "entertaining", "news"])
+_DATE_RANGE_ST = st.integers(min_value=1, max_value=30)
+_SRC_TYPE_ST = st.sampled_from(["email", "rss", "file"])
+
+
 @st.composite
 def valid_app_config(draw: st.DrawFn) -> AppConfig:
     """Generate valid AppConfig objects for testing."""
@@ -179,14 +210,14 @@ def valid_app_config(draw: st.DrawFn) -> AppConfig:
             max_tokens=4096,
         ),
         blog=BlogConfig(
-            format=draw(st.sampled_from(["long-form", "summary", "listicle"])),
-            target_words=draw(st.integers(min_value=200, max_value=2000)),
-            include_sources=draw(st.booleans()),
+            format=draw(_BLOG_FORMAT_ST),
+            target_words=draw(_TARGET_WORDS_ST),
+            include_sources=draw(_INCLUDE_SOURCES_ST),
         ),
         tiktok=TikTokConfig(
-            duration=draw(st.sampled_from([15, 30, 60])),
-            include_visual_cues=draw(st.booleans()),
-            style=draw(st.sampled_from(["educational", "entertaining", "news"])),
+            duration=draw(_TIKTOK_DUR_ST),
+            include_visual_cues=draw(_VISUAL_CUES_ST),
+            style=draw(_TIKTOK_STYLE_ST),
         ),
         notes=NotesConfig(
             account="iCloud",
@@ -196,205 +227,257 @@ def valid_app_config(draw: st.DrawFn) -> AppConfig:
         rss_sources=[
             RSSSourceConfig(url="https://example.com/feed", name="Test Feed")
         ],
-        date_range_days=draw(st.integers(min_value=1, max_value=30)),
+        date_range_days=draw(_DATE_RANGE_ST),
     )
 
 
 @st.composite
 def valid_newsletter_items(draw: st.DrawFn, min_items: int = 1, max_items: int = 5) -> list[NewsletterItem]:
     """Generate a list of valid NewsletterItem objects."""
-    num_items = draw(st.integers(min_value=min_items, max_value=max_items))
-    items = []
-    for i in range(num_items):
-        items.append(NewsletterItem(
+    source_types = draw(st.lists(_SRC_TYPE_ST, min_size=min_items, max_size=max_items))
+    return [
+        NewsletterItem(
             source_name=f"Source {i}",
-            source_type=draw(st.sampled_from(["email", "rss", "file"])),
+            source_type=source_type,
             title=f"Newsletter {i}",
             content=f"Content for newsletter {i} with some text.",
-            published_date=datetime(2024, 1, 15, tzinfo=timezone.utc),
-        ))
-    return items
+            published_date=_FROZEN_TS,
+        )
+        for i, source_type in enumerate(source_types)
+    ]
 
 
-@st.composite
-def valid_synthesized_content(draw: st.DrawFn) -> SynthesizedContent:
-    """Generate valid SynthesizedContent for testing."""
-    items = draw(valid_newsletter_items(min_items=1, max_items=3))
-    topic = TopicGroup(
-        topic="Test Topic",
-        description="Test description",
-        items=items,
-        key_points=["Point 1", "Point 2"],
-    )
-    return SynthesizedContent(
-        topics=[topic],
-        overall_summary="Test summary of content",
-        trending_themes=["AI", "Cloud"],
-        source_count=len(items),
-        date_range=(datetime(2024, 1, 14), datetime(2024, 1, 15)),
+# =============================================================================
+# Explicit Examples
+# =============================================================================
+
+def _make_config(
+    format: str = "long-form",
+    include_sources: bool = True,
+    duration: int = 60,
+    include_visual_cues: bool = True,
+) -> AppConfig:
+    """Build a valid AppConfig with the given blog/TikTok options."""
+    return AppConfig(
+        llm=LLMConfig(
+            provider="openai",
+            model="gpt-4o",
+            api_key_env="OPENAI_API_KEY",
+            max_tokens=4096,
+        ),
+        blog=BlogConfig(
+            format=format,
+            target_words=500,
+            include_sources=include_sources,
+        ),
+        tiktok=TikTokConfig(
+            duration=duration,
+            include_visual_cues=include_visual_cues,
+            style="educational",
+        ),
+        notes=NotesConfig(
+            account="iCloud",
+            blog_folder="Blog Posts",
+            tiktok_folder="TikTok Scripts",
+        ),
+        rss_sources=[
+            RSSSourceConfig(url="https://example.com/feed", name="Test")
+        ],
+        date_range_days=7,
     )
 
 
+def _make_items(count: int) -> list[NewsletterItem]:
+    """Build count distinct newsletter items."""
+    return [
+        NewsletterItem(
+            source_name=f"Source {i}",
+            source_type="rss",
+            title=f"Newsletter {i}",
+            content=f"Content for newsletter {i} with some text.",
+            published_date=_FROZEN_TS,
+        )
+        for i in range(count)
+    ]
+
+
 # =============================================================================
-# Unit Tests for NewsletterContentGenerator
+# Shared Fixtures
 # =============================================================================
 
-class TestNewsletterContentGenerator:
-    """Unit tests for NewsletterContentGenerator."""
+@pytest.fixture(scope="session")
+def sample_config() -> AppConfig:
+    """Create a sample configuration for testing."""
+    return _make_config()
+
+
+@pytest.fixture(scope="session")
+def sample_items() -> list[NewsletterItem]:
+    """Create sample newsletter items for testing.
     
-    @pytest.fixture
-    def sample_config(self) -> AppConfig:
-        """Create a sample configuration for testing."""
-        return AppConfig(
-            llm=LLMConfig(
-                provider="openai",
-                model="gpt-4o",
-                api_key_env="OPENAI_API_KEY",
-                max_tokens=4096,
-            ),
-            blog=BlogConfig(
-                format="long-form",
-                target_words=500,
-                include_sources=True,
-            ),
-            tiktok=TikTokConfig(
-                duration=60,
-                include_visual_cues=True,
-                style="educational",
-            ),
-            notes=NotesConfig(
-                account="iCloud",
-                blog_folder="Blog Posts",
-                tiktok_folder="TikTok Scripts",
-            ),
-            rss_sources=[
-                RSSSourceConfig(url="https://example.com/feed", name="Test")
-            ],
-            date_range_days=7,
+    Shared across tests, so callers must not mutate the list.
+    """
+    return [
+        NewsletterItem(
+            source_name="TechCrunch",
+            source_type="rss",
+            title="AI News",
+            content="AI developments this week...",
+            published_date=_FROZEN_TS,
         )
+    ]
+
+
+@pytest.fixture(scope="module")
+def shared_generator(
+    sample_config: AppConfig,
+) -> Iterator[tuple[NewsletterContentGenerator, SimpleNamespace]]:
+    """Build one generator wired to mock components for the whole module.
+    
+    Property tests reuse it across examples; call _reset_wiring() before
+    each run to swap in the drawn config and items and clear the export call flags.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OPENAI_API_KEY", "test-key")
+        generator = NewsletterContentGenerator(sample_config)
+    
+    yield generator, _wire_mocks(generator)
+
+
+@pytest.fixture
+def wired_generator(
+    sample_config: AppConfig,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[..., tuple[NewsletterContentGenerator, SimpleNamespace]]:
+    """Factory for a fresh generator wired to mock components.
+    
+    Call it with the items the mock aggregator should return; keyword
+    overrides replace individual mocks (aggregator, synthesizer,
+    blog_generator, tiktok_generator, exporter) or set progress_callback.
+    """
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
     
-    @pytest.fixture
-    def sample_items(self) -> list[NewsletterItem]:
-        """Create sample newsletter items for testing."""
-        return [
-            NewsletterItem(
-                source_name="TechCrunch",
-                source_type="rss",
-                title="AI News",
-                content="AI developments this week...",
-                published_date=datetime(2024, 1, 15, tzinfo=timezone.utc),
-            )
-        ]
+    def make(
+        items: list[NewsletterItem] | None = None,
+        progress_callback: Callable[[str, str], None] | None = None,
+        **overrides: Any,
+    ) -> tuple[NewsletterContentGenerator, SimpleNamespace]:
+        generator = NewsletterContentGenerator(
+            sample_config, progress_callback=progress_callback
+        )
+        return generator, _wire_mocks(generator, items, **overrides)
     
-    def test_run_dry_run_does_not_export(self, sample_config: AppConfig, sample_items: list[NewsletterItem]) -> None:
-        """Test that dry-run mode does not call export methods."""
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-            generator = NewsletterContentGenerator(sample_config)
-            
-            # Replace components with mocks
-            mock_aggregator = MockAggregator(sample_items)
-            mock_synthesizer = MockSynthesizer()
-            mock_blog_gen = MockBlogGenerator()
-            mock_tiktok_gen = MockTikTokGenerator()
-            mock_exporter = MockExporter()
-            
-            generator._aggregator = mock_aggregator
-            generator._synthesizer = mock_synthesizer
-            generator._blog_generator = mock_blog_gen
-            generator._tiktok_generator = mock_tiktok_gen
-            generator._exporter = mock_exporter
-            
-            # Run in dry-run mode
-            result = generator.run(dry_run=True)
-            
-            # Verify export was NOT called
-            assert not mock_exporter.export_blog_called
-            assert not mock_exporter.export_tiktok_called
-            
-            # Verify other stages were called
-            assert mock_aggregator.aggregate_called
-            assert mock_synthesizer.synthesize_called
-            assert mock_blog_gen.generate_called
-            assert mock_tiktok_gen.generate_called
+    return make
+
+
+def _wire_mocks(
+    generator: NewsletterContentGenerator,
+    items: list[NewsletterItem] | None = None,
+    **overrides: Any,
+) -> SimpleNamespace:
+    """Swap a generator's components for mocks and return them."""
+    mocks = SimpleNamespace(
+        aggregator=MockAggregator(items),
+        synthesizer=MockSynthesizer(),
+        blog_generator=MockBlogGenerator(),
+        tiktok_generator=MockTikTokGenerator(),
+        exporter=MockExporter(),
+    )
+    vars(mocks).update(overrides)
+    generator._aggregator = mocks.aggregator
+    generator._synthesizer = mocks.synthesizer
+    generator._blog_generator = mocks.blog_generator
+    generator._tiktok_generator = mocks.tiktok_generator
+    generator._exporter = mocks.exporter
+    return mocks
+
+
+def _reset_wiring(
+    generator: NewsletterContentGenerator,
+    mocks: SimpleNamespace,
+    config: AppConfig,
+    items: list[NewsletterItem],
+) -> None:
+    """Prepare a shared generator for a fresh run."""
+    generator.config = config
+    mocks.aggregator.items = items
+    mocks.exporter.export_blog_called = False
+    mocks.exporter.export_tiktok_called = False
+
+
+# =============================================================================
+# Unit Tests for NewsletterContentGenerator
+# =============================================================================
+
+class TestNewsletterContentGenerator:
+    """Unit tests for NewsletterContentGenerator."""
     
-    def test_run_dry_run_returns_none_note_ids(self, sample_config: AppConfig, sample_items: list[NewsletterItem]) -> None:
-        """Test that dry-run mode returns None for note_id fields."""
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-            generator = NewsletterContentGenerator(sample_config)
-            
-            # Replace components with mocks
-            generator._aggregator = MockAggregator(sample_items)
-            generator._synthesizer = MockSynthesizer()
-            generator._blog_generator = MockBlogGenerator()
-            generator._tiktok_generator = MockTikTokGenerator()
-            generator._exporter = MockExporter()
-            
-            result = generator.run(dry_run=True)
-            
-            # Verify note_id is None for both exports
-            assert result.blog_exported is not None
-            assert result.blog_exported.note_id is None
-            assert result.tiktok_exported is not None
-            assert result.tiktok_exported.note_id is None
+    def test_run_dry_run_skips_export(self, wired_generator: Callable[..., Any], sample_items: list[NewsletterItem]) -> None:
+        """Test that dry-run mode runs every stage but export and returns no note IDs."""
+        generator, mocks = wired_generator(items=sample_items)
+        
+        # Run in dry-run mode
+        result = generator.run(dry_run=True)
+        
+        # Verify export was NOT called
+        assert not mocks.exporter.export_blog_called
+        assert not mocks.exporter.export_tiktok_called
+        
+        # Verify other stages were called
+        assert mocks.aggregator.aggregate_called
+        assert mocks.synthesizer.synthesize_called
+        assert mocks.blog_generator.generate_called
+        assert mocks.tiktok_generator.generate_called
+        
+        # Verify note_id is None for both exports
+        assert result.blog_exported is not None
+        assert result.blog_exported.note_id is None
+        assert result.tiktok_exported is not None
+        assert result.tiktok_exported.note_id is None
     
-    def test_run_normal_mode_exports(self, sample_config: AppConfig, sample_items: list[NewsletterItem]) -> None:
+    def test_run_normal_mode_exports(self, wired_generator: Callable[..., Any], sample_items: list[NewsletterItem]) -> None:
         """Test that normal mode calls export methods."""
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-            generator = NewsletterContentGenerator(sample_config)
-            
-            # Replace components with mocks
-            mock_exporter = MockExporter()
-            generator._aggregator = MockAggregator(sample_items)
-            generator._synthesizer = MockSynthesizer()
-            generator._blog_generator = MockBlogGenerator()
-            generator._tiktok_generator = MockTikTokGenerator()
-            generator._exporter = mock_exporter
-            
-            result = generator.run(dry_run=False)
-            
-            # Verify export WAS called
-            assert mock_exporter.export_blog_called
-            assert mock_exporter.export_tiktok_called
+        generator, mocks = wired_generator(items=sample_items)
+        
+        result = generator.run(dry_run=False)
+        
+        # Verify export WAS called
+        assert mocks.exporter.export_blog_called
+        assert mocks.exporter.export_tiktok_called
     
-    def test_run_with_no_newsletters(self, sample_config: AppConfig) -> None:
+    def test_run_with_no_newsletters(self, sample_config: AppConfig, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test behavior when no newsletters are found."""
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-            generator = NewsletterContentGenerator(sample_config)
-            
-            # Replace aggregator with one that returns empty list
-            generator._aggregator = MockAggregator([])
-            
-            result = generator.run(dry_run=False)
-            
-            assert result.success is True
-            assert result.newsletters_processed == 0
-            assert "No newsletters found" in result.errors[0]
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        generator = NewsletterContentGenerator(sample_config)
+        
+        # Replace aggregator with one that returns empty list
+        generator._aggregator = MockAggregator([])
+        
+        result = generator.run(dry_run=False)
+        
+        assert result.success is True
+        assert result.newsletters_processed == 0
+        assert "No newsletters found" in result.errors[0]
     
-    def test_progress_callback_is_called(self, sample_config: AppConfig, sample_items: list[NewsletterItem]) -> None:
+    def test_progress_callback_is_called(self, wired_generator: Callable[..., Any], sample_items: list[NewsletterItem]) -> None:
         """Test that progress callback is called during execution."""
         progress_calls: list[tuple[str, str]] = []
         
         def progress_callback(stage: str, message: str) -> None:
             progress_calls.append((stage, message))
         
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-            generator = NewsletterContentGenerator(sample_config, progress_callback=progress_callback)
-            
-            # Replace components with mocks
-            generator._aggregator = MockAggregator(sample_items)
-            generator._synthesizer = MockSynthesizer()
-            generator._blog_generator = MockBlogGenerator()
-            generator._tiktok_generator = MockTikTokGenerator()
-            generator._exporter = MockExporter()
-            
-            generator.run(dry_run=True)
-            
-            # Verify progress was reported
-            assert len(progress_calls) > 0
-            stages = [call[0] for call in progress_calls]
-            assert "aggregation" in stages
-            assert "synthesis" in stages
-            assert "generation" in stages
+        generator, _ = wired_generator(
+            items=sample_items, progress_callback=progress_callback
+        )
+        
+        generator.run(dry_run=True)
+        
+        # Verify progress was reported
+        assert len(progress_calls) > 0
+        stages = [call[0] for call in progress_calls]
+        assert "aggregation" in stages
+        assert "synthesis" in stages
+        assert "generation" in stages
 
 
 # =============================================================================
@@ -409,9 +492,22 @@ class TestOrchestratorProperties:
         config=valid_app_config(),
         items=valid_newsletter_items(min_items=1, max_items=5),
     )
-    @settings(max_examples=20, deadline=15000)
+    @example(config=_make_config(), items=_make_items(1))
+    @example(
+        config=_make_config(
+            format="listicle",
+            include_sources=False,
+            duration=15,
+            include_visual_cues=False,
+        ),
+        items=_make_items(5),
+    )
+    @settings(max_examples=10, deadline=1000, derandomize=True)
     def test_dry_run_mode(
-        self, config: AppConfig, items: list[NewsletterItem]
+        self,
+        shared_generator: tuple[NewsletterContentGenerator, SimpleNamespace],
+        config: AppConfig,
+        items: list[NewsletterItem],
     ) -> None:
         """
         Property 13: Dry-Run Mode
@@ -425,47 +521,39 @@ class TestOrchestratorProperties:
         """
         assume(len(items) > 0)
         
-        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
-            generator = NewsletterContentGenerator(config)
-            
-            # Replace components with mocks
-            mock_exporter = MockExporter()
-            generator._aggregator = MockAggregator(items)
-            generator._synthesizer = MockSynthesizer()
-            generator._blog_generator = MockBlogGenerator()
-            generator._tiktok_generator = MockTikTokGenerator()
-            generator._exporter = mock_exporter
-            
-            # Run in dry-run mode
-            result = generator.run(dry_run=True)
-            
-            # Property: dry_run flag should be True in result
-            assert result.dry_run is True, "ExecutionResult.dry_run should be True"
-            
-            # Property: Export results should exist
-            assert result.blog_exported is not None, "blog_exported should not be None"
-            assert result.tiktok_exported is not None, "tiktok_exported should not be None"
-            
-            # Property: note_id should be None (no actual notes created)
-            assert result.blog_exported.note_id is None, (
-                "blog_exported.note_id should be None in dry-run mode"
-            )
-            assert result.tiktok_exported.note_id is None, (
-                "tiktok_exported.note_id should be None in dry-run mode"
-            )
-            
-            # Property: Export methods should NOT have been called
-            assert not mock_exporter.export_blog_called, (
-                "export_blog should not be called in dry-run mode"
-            )
-            assert not mock_exporter.export_tiktok_called, (
-                "export_tiktok should not be called in dry-run mode"
-            )
-            
-            # Property: Newsletters should still be processed
-            assert result.newsletters_processed == len(items), (
-                f"Expected {len(items)} newsletters processed, got {result.newsletters_processed}"
-            )
-            
-            # Property: Success should be True (content was generated)
-            assert result.success is True, "Execution should succeed in dry-run mode"
+        generator, mocks = shared_generator
+        _reset_wiring(generator, mocks, config, items)
+        
+        # Run in dry-run mode
+        result = generator.run(dry_run=True)
+        
+        # Property: dry_run flag should be True in result
+        assert result.dry_run is True, "ExecutionResult.dry_run should be True"
+        
+        # Property: Export results should exist
+        assert result.blog_exported is not None, "blog_exported should not be None"
+        assert result.tiktok_exported is not None, "tiktok_exported should not be None"
+        
+        # Property: note_id should be None (no actual notes created)
+        assert result.blog_exported.note_id is None, (
+            "blog_exported.note_id should be None in dry-run mode"
+        )
+        assert result.tiktok_exported.note_id is None, (
+            "tiktok_exported.note_id should be None in dry-run mode"
+        )
+        
+        # Property: Export methods should NOT have been called
+        assert not mocks.exporter.export_blog_called, (
+            "export_blog should not be called in dry-run mode"
+        )
+        assert not mocks.exporter.export_tiktok_called, (
+            "export_tiktok should not be called in dry-run mode"
+        )
+        
+        # Property: Newsletters should still be processed
+        assert result.newsletters_processed == len(items), (
+            f"Expected {len(items)} newsletters processed, got {result.newsletters_processed}"
+        )
+        
+        # Property: Success should be True (content was generated)
+        assert result.success is True, "Execution should succeed in dry-run mode"